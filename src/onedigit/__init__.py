@@ -1,10 +1,15 @@
 """Evaluate expressions that use a single digit from 1 to 9, and basic arithmetic operations."""
 
-from onedigit.cli import app
-from onedigit.combo import Combo
-from onedigit.model import Model
-from onedigit.operations import binary_operation, unary_operation
-from onedigit.simple import advance, calculate, get_model
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from onedigit.cache import cached_calculate
+    from onedigit.cli import app
+    from onedigit.combo import Combo
+    from onedigit.model import Model
+    from onedigit.operations import binary_operation, unary_operation
+    from onedigit.simple import advance, calculate, get_model
 
 __uri__ = "https://github.com/jzer7/onedigit-py"
 __version__ = "0.3.0"
@@ -17,7 +22,43 @@ __all__ = [
     "advance",
     "app",
     "binary_operation",
+    "cached_calculate",
     "calculate",
     "get_model",
     "unary_operation",
 ]
+
+# Modules are only imported when one of their names is used (PEP 562),
+# so 'import onedigit' does not load the whole package.
+_LAZY_IMPORTS = {
+    "Combo": "onedigit.combo",
+    "Model": "onedigit.model",
+    "advance": "onedigit.simple",
+    "app": "onedigit.cli",
+    "binary_operation": "onedigit.operations",
+    "cached_calculate": "onedigit.cache",
+    "calculate": "onedigit.simple",
+    "get_model": "onedigit.simple",
+    "unary_operation": "onedigit.operations",
+}
+
+# Submodules are also imported on first use, as 'onedigit.combo' worked
+# when the package imported all of them
+_SUBMODULES = frozenset(["cache", "cli", "combo", "jsonio", "logger", "model", "operations", "simple"])
+
+
+def __getattr__(name: str) -> Any:
+    """Import the public names of the package on first use."""
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    if name in _SUBMODULES:
+        # Importing a submodule also binds it in the package namespace
+        return import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """List the names of the package, including the ones not imported yet."""
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES)
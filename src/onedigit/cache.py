@@ -0,0 +1,146 @@
+"""Persistent cache of calculation results, stored as JSON model files."""
+
+import contextlib
+import hashlib
+import os
+
+from . import __version__
+from .jsonio import decode_json, write_json
+from .logger import get_logger
+from .model import Model
+from .simple import calculate
+
+logger = get_logger(__name__)
+
+
+def default_cache_dir() -> str:
+    """
+    Get the directory used to store cached models.
+
+    It follows the XDG convention: '$XDG_CACHE_HOME/onedigit', or
+    '~/.cache/onedigit' when the variable is not set.
+
+    Returns:
+        str: path of the cache directory.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "onedigit")
+
+
+def cache_key(digit: int, *, max_value: int, max_cost: int, max_steps: int, input_json: str | bytes) -> str:
+    """
+    Build the key that identifies a calculation.
+
+    The version of the package is part of the key, so results cached by a
+    release are not used by another one, whose search may differ.
+
+    Args:
+        digit (int): digit to use
+        max_value (int): largest value to remember.
+        max_cost (int): maximum cost a combination can have to be remembered.
+        max_steps (int): maximum number of steps (iterations) to run.
+        input_json (str | bytes): JSON model data used as starting point.
+
+    Returns:
+        str: hexadecimal digest of the parameters and input data.
+    """
+    if isinstance(input_json, str):
+        input_json = input_json.encode("utf-8")
+
+    h = hashlib.blake2b(digest_size=20)
+    h.update(f"{__version__}:{digit}:{max_value}:{max_cost}:{max_steps}:".encode())
+    h.update(input_json)
+    return h.hexdigest()
+
+
+def load(key: str, cache_dir: str) -> Model | None:
+    """
+    Get a model from the cache.
+
+    Args:
+        key (str): key of the calculation (see cache_key()).
+        cache_dir (str): directory with the cached models.
+
+    Returns:
+        Model: the cached model, or None if it is not in the cache.
+    """
+    filename = os.path.join(cache_dir, key + ".json")
+    try:
+        with open(filename, mode="rb") as cache_fp:
+            model_dict = decode_json(cache_fp.read())
+        # The cache directory is writable by the user, so files are validated
+        return Model.fromdict(model_dict)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"ignoring unreadable cache file '{filename}': {e}")
+        return None
+
+
+def store(key: str, cache_dir: str, model: Model) -> None:
+    """
+    Add a model to the cache.
+
+    Failures are logged but otherwise ignored, the cache is only an
+    optimization.
+
+    Args:
+        key (str): key of the calculation (see cache_key()).
+        cache_dir (str): directory with the cached models.
+        model (Model): model to store.
+    """
+    filename = os.path.join(cache_dir, key + ".json")
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write to a temporary file first, so readers never see partial files
+        tmp_filename = f"{filename}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_filename, mode="wb") as cache_fp:
+                write_json(model.asdict(), cache_fp)
+            os.replace(tmp_filename, filename)
+        except OSError:
+            # Do not leave partial files behind
+            with contextlib.suppress(OSError):
+                os.remove(tmp_filename)
+            raise
+    except OSError as e:
+        logger.warning(f"failed to write cache file '{filename}': {e}")
+
+
+def cached_calculate(
+    digit: int,
+    *,
+    max_value: int = 9999,
+    max_cost: int = 10,
+    max_steps: int = 10,
+    input_json: str | bytes,
+    cache_dir: str = "",
+) -> Model | None:
+    """
+    Run a simple calculation, reusing the result of an identical previous run.
+
+    Results are kept on disk, so they are shared between processes.
+
+    Args:
+        digit (int): digit to use
+        max_value (int, optional): largest value to remember. Defaults to 9999.
+        max_cost (int, optional): maximum cost a combination can have to be remembered. Defaults to 10.
+        max_steps (int, optional): maximum number of steps (iterations) to run. Defaults to 10.
+        input_json (str | bytes): JSON model data, as text or UTF-8 bytes.
+        cache_dir (str, optional): directory with the cached models. Defaults to default_cache_dir().
+
+    Returns:
+        Model: model object, or None if there is a failure.
+    """
+    cache_dir = cache_dir or default_cache_dir()
+    key = cache_key(digit, max_value=max_value, max_cost=max_cost, max_steps=max_steps, input_json=input_json)
+
+    model = load(key, cache_dir)
+    if model:
+        logger.info(f"using cached model '{key}'")
+        return model
+
+    model = calculate(digit, max_value=max_value, max_cost=max_cost, max_steps=max_steps, input_json=input_json)
+    if model:
+        store(key, cache_dir, model)
+    return model
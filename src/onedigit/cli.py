@@ -3,15 +3,71 @@
 
 import argparse
 import datetime
-import json
-from typing import Optional
-
+import functools
+import logging
+import os
+import sys
+from collections.abc import Callable
+from typing import Any, Optional
+
+from .jsonio import write_json
 from .logger import get_logger
+from .model import Model
 from .simple import calculate
 
 logger = get_logger(__name__)
 
 
+def _digit_list(text: str) -> list[int]:
+    """
+    Parse the digit argument, either a single digit or a range of digits.
+
+    Args:
+        text (str): argument text, such as '3' or '1-9'.
+
+    Raises:
+        argparse.ArgumentTypeError: when the text is not a digit or a range.
+
+    Returns:
+        list[int]: digits requested, in increasing order.
+    """
+    first, sep, last = text.partition("-")
+    try:
+        lo = int(first)
+        hi = int(last) if sep else lo
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid digit or range of digits: '{text}'") from None
+    if not (1 <= lo <= 9 and 1 <= hi <= 9):
+        raise argparse.ArgumentTypeError(f"digit must be an integer number between 1 and 9, got '{text}'")
+    if lo > hi:
+        raise argparse.ArgumentTypeError(f"range of digits must be in increasing order, got '{text}'")
+    return list(range(lo, hi + 1))
+
+
+def _ranged_int(lo: int, hi: int) -> Callable[[str], int]:
+    """
+    Build an argparse type that accepts integers within a range.
+
+    Args:
+        lo (int): smallest value accepted.
+        hi (int): largest value accepted.
+
+    Returns:
+        Callable[[str], int]: function that converts the argument text to an integer.
+    """
+
+    def parse(text: str) -> int:
+        try:
+            value = int(text)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid integer number: '{text}'") from None
+        if not (lo <= value <= hi):
+            raise argparse.ArgumentTypeError(f"must be a positive number between {lo:,} and {hi:,}, got '{text}'")
+        return value
+
+    return parse
+
+
 def _create_parser() -> argparse.ArgumentParser:
     """
     Create the argument parser for the CLI.
@@ -28,31 +84,36 @@ Examples:
   onedigit 7 --max-value 100      # Use digit 7, show values up to 100
   onedigit 5 --full               # Show full expressions instead of simple
   onedigit 3 --input input.json   # Load model from JSON file
+  onedigit 1-9 --jobs 4           # Use digits 1 to 9, running 4 calculations at a time
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
     # Required positional argument
-    parser.add_argument("digit", type=int, help="The digit to use to generate combinations (1-9)")
+    parser.add_argument(
+        "digit",
+        type=_digit_list,
+        help="The digit to use to generate combinations (1-9), or a range of digits (for example, 1-9)",
+    )
 
     # Optional arguments
     parser.add_argument(
         "--max-value",
-        type=int,
+        type=_ranged_int(1, 1_000_000),
         default=9999,
         help="Largest value for a combination to be shown in the output (default: 9999)",
     )
 
     parser.add_argument(
         "--max-cost",
-        type=int,
+        type=_ranged_int(1, 30),
         default=2,
         help="Maximum cost a combination can have for it to be remembered (default: 2)",
     )
 
     parser.add_argument(
         "--max-steps",
-        type=int,
+        type=_ranged_int(1, 100),
         default=5,
         help="Maximum number of generative rounds (default: 5)",
     )
@@ -78,9 +139,34 @@ Examples:
         help="JSON file used to store the model upon completion. If not provided, a random filename will be used",
     )
 
+    parser.add_argument(
+        "--jobs",
+        type=_ranged_int(1, 256),
+        default=1,
+        help="Number of processes used when calculating a range of digits (default: 1)",
+    )
+
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        default=False,
+        help="Reuse results of previous runs with the same arguments, stored under ~/.cache/onedigit",
+    )
+
     return parser
 
 
+@functools.cache
+def _get_parser() -> argparse.ArgumentParser:
+    """
+    Get the argument parser for the CLI, creating it on first use.
+
+    Returns:
+        argparse.ArgumentParser: Configured argument parser, shared between calls
+    """
+    return _create_parser()
+
+
 def app(args: Optional[list[str]] = None) -> bool:
     """
     Main entry point for the argparse-based CLI.
@@ -94,7 +180,7 @@ def app(args: Optional[list[str]] = None) -> bool:
     Returns:
         bool: True if calculation runs without issues, False otherwise
     """
-    parser = _create_parser()
+    parser = _get_parser()
 
     try:
         parsed_args = parser.parse_args(args)
@@ -102,59 +188,43 @@ def app(args: Optional[list[str]] = None) -> bool:
         # argparse calls sys.exit() on error, we catch it to return False
         return e.code == 0
 
-    digit = parsed_args.digit
-
-    # Set default values for arguments not provided
-    max_value = parsed_args.max_value if parsed_args.max_value is not None else 9999
-    max_cost = parsed_args.max_cost if parsed_args.max_cost is not None else 2
-    max_steps = parsed_args.max_steps if parsed_args.max_steps is not None else 5
-    input_filename = parsed_args.input_filename or ""
-    output_filename = parsed_args.output_filename or ""
-
-    # ------------------------------------------------------------
-    # Input validation and sanitization
-    try:
-        digit = int(digit)
-        max_value = int(max_value)
-        max_cost = int(max_cost)
-        max_steps = int(max_steps)
-    except (ValueError, TypeError):
-        logger.error("digit, max_value, max_cost, and max_steps must be positive integer numbers")
-        return False
-
-    if not (1 <= digit <= 9):
-        logger.error("digit must be an integer number between 1 and 9")
-        return False
-
-    if not (1 <= max_value <= 1_000_000):
-        logger.error("max_value must be a positive number between 1 and 1,000,000")
-        return False
-
-    if not (1 <= max_cost <= 30):
-        logger.error("max_cost must be a positive number between 1 and 30")
-        return False
-
-    if not (1 <= max_steps <= 100):
-        logger.error("max_steps must be a positive number between 1 and 100")
-        return False
-
-    if not isinstance(input_filename, str):
-        logger.error("input_filename is not valid")
-        return False
-
-    if not isinstance(output_filename, str):
-        logger.error("output_filename is not valid")
+    # Values were already converted and range checked by the parser
+    digits = parsed_args.digit
+    max_value = parsed_args.max_value
+    max_cost = parsed_args.max_cost
+    max_steps = parsed_args.max_steps
+    jobs = parsed_args.jobs
+    input_filename = parsed_args.input_filename
+    output_filename = parsed_args.output_filename
+
+    if len(digits) > 1 and input_filename:
+        logger.error("input_filename can only be used with a single digit")
         return False
+    if len(digits) == 1 and jobs > 1:
+        logger.warning("jobs is ignored, a single digit is calculated in one process")
 
     # Call the (internal) main function with parsed arguments
+    if len(digits) > 1:
+        return _main_digits(
+            digits=digits,
+            max_value=max_value,
+            max_cost=max_cost,
+            max_steps=max_steps,
+            full=parsed_args.full,
+            output_filename=output_filename,
+            cache=parsed_args.cache,
+            jobs=jobs,
+        )
+
     return _main(
-        digit=parsed_args.digit,
+        digit=digits[0],
         max_value=max_value,
         max_cost=max_cost,
         max_steps=max_steps,
         full=parsed_args.full,
         input_filename=input_filename,
         output_filename=output_filename,
+        cache=parsed_args.cache,
     )
 
 
@@ -166,6 +236,7 @@ def _main(
     full: bool,
     input_filename: str,
     output_filename: str,
+    cache: bool = False,
 ) -> bool:
     """
     Internal main function to perform the calculation.
@@ -180,85 +251,202 @@ def _main(
         full (bool): display combinations using full expressions.
         input_filename (str): JSON file used to preload the model.
         output_filename (str): JSON file used to store the model upon completion. If not filename is provided, a random filename will be used.
+        cache (bool, optional): reuse results of previous runs with the same arguments. Defaults to False.
 
     Returns:
         bool: True if calculation runs without issues.
     """
-    logger.debug(
-        f"calculate(digit={type(digit).__name__}({digit}), "
-        f"max_value={type(max_value).__name__}({max_value}), "
-        f"max_steps={type(max_steps).__name__}({max_steps}), "
-        f"max_cost={type(max_cost).__name__}({max_cost}), "
-        f"input_filename={type(input_filename).__name__}({input_filename}), "
-        f"output_filename={type(output_filename).__name__}({output_filename})"
-    )
+    # Skip building the message when debug records are not handled
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"calculate(digit={type(digit).__name__}({digit}), "
+            f"max_value={type(max_value).__name__}({max_value}), "
+            f"max_steps={type(max_steps).__name__}({max_steps}), "
+            f"max_cost={type(max_cost).__name__}({max_cost}), "
+            f"input_filename={type(input_filename).__name__}({input_filename}), "
+            f"output_filename={type(output_filename).__name__}({output_filename}), "
+            f"cache={cache}"
+        )
 
     # ------------------------------------------------------------
     if not output_filename:
-        tz = datetime.UTC
-        t = datetime.datetime.now(tz)
-        output_filename = "model" + "." + t.strftime("%Y%m%d%H%M%S") + ".json"
-
-        # ------------------------------------------------------------
-        tz = datetime.UTC
-        t = datetime.datetime.now(tz)
-        output_filename = "model" + "." + t.strftime("%Y%m%d%H%M%S") + ".json"
+        output_filename = _default_output_filename()
 
     # ------------------------------------------------------------
     # Check if there is input data
-    input_text = ""
+    input_bytes = b""
     if input_filename:
-        input_lines = []
-        try:
-            with open(input_filename, mode="r", encoding="utf-8") as input_fp:
-                input_lines = input_fp.readlines()
-        except FileNotFoundError:
-            logger.error(f"The input file '{input_filename}' does not exist.")
-            return False
-        except PermissionError:
-            logger.error(f"No permissions to open the input file '{input_filename}'.")
-            return False
-        except Exception:
-            logger.error(f"Unknown error opening the input file '{input_filename}'.")
+        read_bytes = _read_input(input_filename)
+        if read_bytes is None:
             return False
-
-        if not input_lines:
-            logger.error(f"failed to read input file '{input_filename}', simulation will use a fresh model.")
-        else:
-            input_text = "".join(input_lines)
-        del input_lines
+        input_bytes = read_bytes
 
     # Start calculation
-    model = calculate(
+    model = _calculate_fn(cache)(
         digit=digit,
         max_value=max_value,
         max_cost=max_cost,
         max_steps=max_steps,
-        input_json=input_text,
+        input_json=input_bytes,
     )
-    del input_text
+    del input_bytes
 
-    # ------------------------------------------------------------
-    # Get the combinations
-    combos = []
     if not model:
         logger.error("failure creating and running model")
         return False
+
+    return _output(model, full=full, output_filename=output_filename)
+
+
+def _main_digits(
+    digits: list[int],
+    max_value: int,
+    max_cost: int,
+    max_steps: int,
+    full: bool,
+    output_filename: str,
+    cache: bool = False,
+    jobs: int = 1,
+) -> bool:
+    """
+    Internal main function to perform the calculation for several digits.
+
+    Each digit is an independent calculation. With more than one job,
+    they run in separate processes. Results are written to one file
+    per digit, adding the digit to the output filename (for example,
+    'output.json' becomes 'output.3.json').
+
+    Args:
+        digits (list[int]): the digits to use to generate combinations.
+        max_value (int): largest value for a combination to be shown in the output.
+        max_cost (int): maximum cost a combination can have for it to be remembered.
+        max_steps (int): maximum number of generative rounds.
+        full (bool): display combinations using full expressions.
+        output_filename (str): JSON file used to store the models upon completion. If not filename is provided, a random filename will be used.
+        cache (bool, optional): reuse results of previous runs with the same arguments. Defaults to False.
+        jobs (int, optional): number of processes to use. Defaults to 1.
+
+    Returns:
+        bool: True if all calculations run without issues.
+    """
+    logger.debug(f"_main_digits(digits={digits}, jobs={jobs})")
+
+    if not output_filename:
+        output_filename = _default_output_filename()
+    root, ext = os.path.splitext(output_filename)
+
+    calculate_fn = _calculate_fn(cache)
+    kwargs: dict[str, Any] = {"max_value": max_value, "max_cost": max_cost, "max_steps": max_steps, "input_json": b""}
+
+    if jobs > 1:
+        # Only imported when needed, it adds to the start time of every run
+        import concurrent.futures
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers=min(jobs, len(digits))) as executor:
+            futures = [executor.submit(calculate_fn, digit, **kwargs) for digit in digits]
+            models = [f.result() for f in futures]
     else:
-        combos = sorted(model.state.values())
+        models = [calculate_fn(digit, **kwargs) for digit in digits]
+
+    success = True
+    for digit, model in zip(digits, models):
+        if not model:
+            logger.error(f"failure creating and running model for digit {digit}")
+            success = False
+            continue
+
+        sys.stdout.write(f"# digit {digit}\n")
+        success &= _output(model, full=full, output_filename=f"{root}.{digit}{ext}")
+
+    return success
+
+
+def _calculate_fn(cache: bool) -> Callable[..., Model | None]:
+    """
+    Get the function that runs a calculation.
+
+    Args:
+        cache (bool): reuse results of previous runs with the same arguments.
+
+    Returns:
+        Callable: calculate(), or cached_calculate() when using the cache.
+    """
+    if not cache:
+        return calculate
+
+    # Only imported when needed, it adds to the start time of every run
+    from .cache import cached_calculate
+
+    return cached_calculate
+
+
+def _default_output_filename() -> str:
+    """
+    Build a filename for the output model, based on the current time.
+
+    Returns:
+        str: filename, with the format 'model.YYYYMMDDHHMMSS.json'.
+    """
+    t = datetime.datetime.now(datetime.UTC)
+    return "model" + "." + t.strftime("%Y%m%d%H%M%S") + ".json"
+
+
+def _read_input(input_filename: str) -> bytes | None:
+    """
+    Read the contents of the input model file.
+
+    Args:
+        input_filename (str): JSON file used to preload the model.
+
+    Returns:
+        bytes: contents of the file, or None if the file can not be read.
+    """
+    input_bytes = b""
+    try:
+        with open(input_filename, mode="rb") as input_fp:
+            input_bytes = input_fp.read()
+    except FileNotFoundError:
+        logger.error(f"The input file '{input_filename}' does not exist.")
+        return None
+    except PermissionError:
+        logger.error(f"No permissions to open the input file '{input_filename}'.")
+        return None
+    except Exception:
+        logger.error(f"Unknown error opening the input file '{input_filename}'.")
+        return None
+
+    if not input_bytes:
+        logger.error(f"failed to read input file '{input_filename}', simulation will use a fresh model.")
+
+    return input_bytes
+
+
+def _output(model: Model, full: bool, output_filename: str) -> bool:
+    """
+    Write the model to a file, and its combinations to the terminal.
+
+    Args:
+        model (Model): model with the combinations.
+        full (bool): display combinations using full expressions.
+        output_filename (str): JSON file used to store the model.
+
+    Returns:
+        bool: True if the output was written without issues.
+    """
+    # ------------------------------------------------------------
+    # Get the combinations
+    combos = list(model.iter_sorted())
 
     # ------------------------------------------------------------
     # Take care of outputs
     if output_filename:
-        # Represent model in JSON format
-        model_dict = model.asdict()
-        jsenc = json.JSONEncoder()
-        jstxt = jsenc.encode(model_dict)
+        # Represent model in JSON format, reusing the sorted combinations
+        model_dict = model.asdict(combos)
 
         # Write the whole model to a file
         try:
-            with open(output_filename, mode="w", encoding="utf-8") as output_fp:
-                output_fp.write(jstxt)
+            with open(output_filename, mode="wb") as output_fp:
+                write_json(model_dict, output_fp)
         except PermissionError:
             logger.error(f"failed to open output file '{output_filename}' in write mode.")
             return False
@@ -267,11 +455,10 @@ def _main(
             return False
 
     # ------------------------------------------------------------
-    # Output to terminal
-    for c in combos:
-        if full:
-            print(f"{c.value:>4} = {c.expr_full:<70}   [{c.cost:>3}]")
-        else:
-            print(f"{c.value:>4} = {c.expr_simple:<15}   [{c.cost:>3}]")
+    # Output to terminal, handing all lines to a single writelines() call
+    if full:
+        sys.stdout.writelines(f"{c.value:>4} = {c.expr_full:<70}   [{c.cost:>3}]\n" for c in combos)
+    else:
+        sys.stdout.writelines(f"{c.value:>4} = {c.expr_simple:<15}   [{c.cost:>3}]\n" for c in combos)
 
     return True
@@ -10,12 +10,22 @@ from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Keys needed to build a Combo from a dictionary, with the type of their values
+_SCHEMA = (
+    ("value", int, "an integer"),
+    ("cost", int, "an integer"),
+    ("expr_full", str, "a string"),
+    ("expr_simple", str, "a string"),
+)
 
-@dataclasses.dataclass
+
+@dataclasses.dataclass(slots=True, frozen=True)
 class Combo:
     """
     Represents an arithmetic combination using a single digit.
 
+    Objects are immutable (and hashable).
+
     Args:
         value (int): value of the expression after evaluation.
         cost (int): number of times the digit is used in the expression.
@@ -26,18 +36,17 @@ class Combo:
     """
 
     value: int
-    cost: int = 0  # (set to 10**9 if empty)
+    cost: int = 10**9
     expr_full: str = ""  # (set to str(value) if empty)
     expr_simple: str = ""  # (set to str(value) if empty)
 
     def __post_init__(self) -> None:
         """Run after instantiation of a dataclass object."""
-        if self.cost == 0:
-            self.cost = 10**9
+        # The dataclass is frozen, so defaults are set through object.__setattr__
         if not self.expr_full:
-            self.expr_full = str(self.value)
+            object.__setattr__(self, "expr_full", str(self.value))
         if not self.expr_simple:
-            self.expr_simple = str(self.value)
+            object.__setattr__(self, "expr_simple", str(self.value))
 
     def __repr__(self) -> str:
         """
@@ -80,26 +89,34 @@ class Combo:
         Raises:
             ValueError: when the input dictionary is not valid.
         """
-        # Keys with integer values
-        for k in ["value", "cost"]:
-            if k not in input:
-                raise ValueError(f"input dictionary is missing key '{k}'")
-            v = input[k]
-            if not isinstance(v, int):
-                raise ValueError(f"value associated with key '{k}' must be an integer, but is '{type(v).__name__}'")
-
-        # Keys with string values
-        for k in ["expr_full", "expr_simple"]:
-            if k not in input:
-                raise ValueError(f"input dictionary is missing key '{k}'")
-            v = input[k]
-            if not isinstance(v, str):
-                raise ValueError(f"value associated with key '{k}' must be a string, but is '{type(v).__name__}'")
-
-        value = input["value"]
-        cost = input["cost"]
-        expr_full = input["expr_full"]
-        expr_simple = input["expr_simple"]
+        if not isinstance(input, dict):
+            raise ValueError(f"input must be a dictionary, but is '{type(input).__name__}'")
+
+        # A single check for the common case, where the input is valid.
+        # The schema is only walked to describe what is wrong.
+        try:
+            value, cost = input["value"], input["cost"]
+            expr_full, expr_simple = input["expr_full"], input["expr_simple"]
+        except KeyError:
+            value = cost = expr_full = expr_simple = None
+
+        if not (
+            isinstance(value, int)
+            and isinstance(cost, int)
+            and isinstance(expr_full, str)
+            and isinstance(expr_simple, str)
+        ):
+            for k, k_type, k_desc in _SCHEMA:
+                if k not in input:
+                    raise ValueError(f"input dictionary is missing key '{k}'")
+            for k, k_type, k_desc in _SCHEMA:
+                v = input[k]
+                if not isinstance(v, k_type):
+                    raise ValueError(f"value associated with key '{k}' must be {k_desc}, but is '{type(v).__name__}'")
+
+        # Every combination uses the digit at least once, a free one would skew the search
+        if cost < 1:
+            raise ValueError(f"value associated with key 'cost' must be at least 1, but is {cost}")
 
         return Combo(value=value, cost=cost, expr_full=expr_full, expr_simple=expr_simple)
 
@@ -114,4 +131,10 @@ class Combo:
         Returns:
             dict[str, Any]: dictionary with the dataclass fields.
         """
-        return dataclasses.asdict(self)
+        # Built by hand, as dataclasses.asdict() deep-copies every field
+        return {
+            "value": self.value,
+            "cost": self.cost,
+            "expr_full": self.expr_full,
+            "expr_simple": self.expr_simple,
+        }
@@ -0,0 +1,83 @@
+"""JSON encoding and decoding of models, using orjson when it is installed."""
+
+import json
+from typing import Any, BinaryIO
+
+# orjson is optional, it is only used to speed up reading and writing models
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover
+    _HAS_ORJSON = False
+
+
+def decode_json(input_json: str | bytes) -> Any:
+    """
+    Decode JSON text.
+
+    Args:
+        input_json (str | bytes): JSON text, as a string or UTF-8 bytes.
+
+    Returns:
+        Any: the decoded object.
+    """
+    if _HAS_ORJSON:
+        return orjson.loads(input_json)
+    return json.loads(input_json)
+
+
+# Number of list items encoded at once when writing JSON
+_CHUNK_SIZE = 4096
+
+
+def _dumps(obj: Any) -> bytes:
+    """
+    Encode an object as compact UTF-8 JSON text.
+
+    Args:
+        obj (Any): object to encode.
+
+    Returns:
+        bytes: JSON representation of the object.
+    """
+    if _HAS_ORJSON:
+        try:
+            return orjson.dumps(obj)
+        except orjson.JSONEncodeError:
+            # orjson only handles integers up to 64 bits
+            pass
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def write_json(obj: dict[str, Any], output_fp: BinaryIO) -> None:
+    """
+    Write a dictionary as compact UTF-8 JSON text to a binary file.
+
+    The JSON text is written as it is produced, instead of building it
+    all in memory first. Large lists (like the combinations of a model)
+    are encoded a chunk of items at a time, so each write is large and
+    uses the one-shot encoder (orjson, or the C encoder of json).
+
+    Args:
+        obj (dict[str, Any]): dictionary to write.
+        output_fp (BinaryIO): file object opened in binary mode.
+    """
+    output_fp.write(b"{")
+    for i, (key, value) in enumerate(obj.items()):
+        if i:
+            output_fp.write(b",")
+        output_fp.write(_dumps(key) + b":")
+
+        if not isinstance(value, list) or len(value) <= _CHUNK_SIZE:
+            output_fp.write(_dumps(value))
+            continue
+
+        output_fp.write(b"[")
+        for start in range(0, len(value), _CHUNK_SIZE):
+            if start:
+                output_fp.write(b",")
+            # Drop the brackets of each chunk, they are part of a single list
+            output_fp.write(_dumps(value[start : start + _CHUNK_SIZE])[1:-1])
+        output_fp.write(b"]")
+    output_fp.write(b"}")
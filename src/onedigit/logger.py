@@ -2,6 +2,7 @@
 
 import logging
 import logging.handlers
+import os
 
 # Root logger : used only by other libraries
 logging.basicConfig(level=logging.INFO, format="%(levelname)s - %(message)s")
@@ -20,6 +21,9 @@ _main_logger = logging.getLogger("onedigit")
 #     we want the user to see right away.
 #   * The log file will get messages DEBUG and higher,
 #     information for post execution analysis
+# The level of the main logger is read from the environment
+# variable ONEDIGIT_LOG_LEVEL (DEBUG by default). With a higher
+# level, debug messages are not even built.
 # -----------------------------------------------------------
 
 
@@ -27,8 +31,8 @@ def init_logger() -> None:
     """Init logger."""
     _main_logger.handlers = []
 
-    _main_logger.setLevel(logging.INFO)
-    _main_logger.setLevel(logging.DEBUG)
+    level_name = os.environ.get("ONEDIGIT_LOG_LEVEL", "DEBUG").upper()
+    _main_logger.setLevel(logging.getLevelNamesMapping().get(level_name, logging.DEBUG))
 
     # create formatters
     consoleformatter = logging.Formatter("%(levelname)s - %(message)s")
@@ -44,9 +48,10 @@ def init_logger() -> None:
     _main_logger.addHandler(ch)
 
     # create file handler which logs more information (lower level
-    # errors, as well as time information)
+    # errors, as well as time information). The file is only opened
+    # when the first message is logged, not when the package is imported.
     fh = logging.handlers.RotatingFileHandler(
-        filename="calculate.log", maxBytes=100000, backupCount=5, encoding="utf-8"
+        filename="calculate.log", maxBytes=100000, backupCount=5, encoding="utf-8", delay=True
     )
     fh.setLevel(logging.DEBUG)
     fh.setFormatter(fileformatter)
@@ -3,11 +3,13 @@
 # Needed so classes can make self references to their type
 from __future__ import annotations
 
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
 from typing import Any, List
 
 from .combo import Combo
 from .logger import get_logger
-from .operations import binary_operation, unary_operation
+from .operations import BINARY_VALUES, binary_operation, max_exponent, unary_operation, unary_value
 
 logger = get_logger(__name__)
 
@@ -19,6 +21,7 @@ class Model:
     max_value: int = 0
     max_cost: int = 0
     state: dict[int, Combo]
+    expanded: set[Combo]
 
     def __init__(self, digit: int) -> None:
         """
@@ -37,6 +40,8 @@ class Model:
         self.digit = digit
 
         self.state = {}
+        # Combinations already used as operands in a previous round
+        self.expanded = set()
 
     def seed(self, *, max_value: int = 0, max_cost: int = 0) -> None:
         """
@@ -60,6 +65,9 @@ class Model:
             raise ValueError("maximum cost must be a positive number below 30.")
         self.max_cost = max_cost
 
+        # Limits may have changed, so previous rounds need to be revisited
+        self.expanded = set()
+
         # Set up the digit for the simulation
         self.state[self.digit] = Combo(
             value=self.digit,
@@ -97,6 +105,7 @@ class Model:
         new_model.max_value = self.max_value
         new_model.max_cost = self.max_cost
         new_model.state = self.state.copy()
+        new_model.expanded = self.expanded.copy()
         return new_model
 
     @classmethod
@@ -142,6 +151,30 @@ class Model:
         """
         return f"Model(digit={self.digit}, max_value={self.max_value}, max_cost={self.max_cost})"
 
+    def is_improvement(self, value: int, cost: int) -> bool:
+        """
+        Check if a combination would be added to the existing state.
+
+        It lets callers check a result before building its Combo object.
+
+        Args:
+            value (int): value of the combination.
+            cost (int): cost of the combination.
+
+        Returns:
+            bool: True if state_update() would accept such combination.
+        """
+        if cost > self.max_cost:
+            return False
+
+        # Are we keeping track of this value?
+        if not (1 <= value <= self.max_value):
+            return False
+
+        # There was no improvement in cost
+        current = self.state.get(value)
+        return current is None or cost < current.cost
+
     def state_update(self, candidate: Combo) -> bool:
         """
         Attempt addition of a single combination to the existing state.
@@ -157,20 +190,10 @@ class Model:
         """
         # logger.debug("Model.state_update()")
 
-        if candidate.cost > self.max_cost:
+        if not self.is_improvement(candidate.value, candidate.cost):
             return False
 
-        value, cost = candidate.value, candidate.cost
-
-        # Are we keeping track of this value?
-        if not (1 <= value <= self.max_value):
-            return False
-
-        # There was no improvement in cost
-        if (value in self.state) and (self.state[value].cost <= cost):
-            return False
-
-        self.state[value] = candidate
+        self.state[candidate.value] = candidate
         return True
 
     def state_merge(self, extra: Model) -> None:
@@ -202,41 +225,125 @@ class Model:
 
         The function takes all existing combinations, and applies
         operations that generate new values, and stores them in a
-        separate object. Once all initial values are processed, we
-        merge combinations from the new object. That prevents recursive
+        separate buffer. Once all initial values are processed, we
+        merge combinations from the buffer. That prevents recursive
         loops, and let us determine liveness.
 
+        Operations between two combinations that were both known in a
+        previous round are skipped, as they were already evaluated then
+        and can not improve the current state.
+
         Returns:
             int: number of values that were updated
         """
         known = list(self.state.values())
         known.sort(key=lambda c: c.value)
-        new_combos = self.copy()
+        fresh = [c for c in known if c not in self.expanded]
+
+        # Results are checked by value and cost first, expressions are
+        # only built for results that improve the state. Costs are kept
+        # in a list indexed by value, to check results without a lookup
+        # of their Combo object (values not found cost above the limit).
+        max_value, max_cost = self.max_value, self.max_cost
+        best_cost = [max_cost + 1] * (max_value + 1)
+        for known_value, known_combo in self.state.items():
+            if 1 <= known_value <= max_value:
+                best_cost[known_value] = min(known_combo.cost, max_cost + 1)
+
+        # Improvements found in this round, they are only merged into the
+        # state at the end of the round. Results that pass the check above
+        # are always an improvement, so they are stored directly.
+        delta: dict[int, Combo] = {}
+
+        def add(candidate: Combo) -> bool:
+            delta[candidate.value] = candidate
+            best_cost[candidate.value] = candidate.cost
+            return True
+
+        # Partners (still sorted by value) that fit in a cost budget, so
+        # pairs over the cost limit are never visited. Lists are built
+        # once per budget, and per group (all or only fresh combinations).
+        budget_partners: dict[tuple[bool, int], tuple[list[Combo], list[int]]] = {}
+
+        def partners_within(only_fresh: bool, budget: int) -> tuple[list[Combo], list[int]]:
+            key = (only_fresh, budget)
+            if key not in budget_partners:
+                combos = [c for c in (fresh if only_fresh else known) if c.cost <= budget]
+                budget_partners[key] = combos, [c.value for c in combos]
+            return budget_partners[key]
+
+        # Operations are looked up once, and called directly for each pair
+        power_value = BINARY_VALUES["^"]
 
         updates = 0
         for combo1 in known:
-            # Unary operations
-            #   !:    factorial
-            #   sqrt: square root
-            for op in ["!", "sqrt"]:
-                updates += new_combos.state_update(unary_operation(combo1, op=op))
+            value1, cost1 = combo1.value, combo1.cost
+
+            # Pair an already expanded combination only with fresh ones
+            if combo1 in self.expanded:
+                partners, partner_values = partners_within(True, max_cost - cost1)
+            else:
+                partners, partner_values = partners_within(False, max_cost - cost1)
+
+                # Unary operations
+                #   !:    factorial
+                #   sqrt: square root
+                # Factorial is only valid up to 20, most values skip it
+                for op in ["!", "sqrt"] if value1 <= 20 else ["sqrt"]:
+                    value = unary_value(value1, op)
+                    if value is not None and 1 <= value <= max_value and cost1 < best_cost[value]:
+                        updates += add(unary_operation(combo1, op=op))
+
+            # Partners are sorted by value, so the ones that can give a
+            # valid result are a prefix of the list: values up to value1
+            # for + - * /, and up to the largest useful exponent for ^.
+            # Identities never improve the state, as they give back one of
+            # the operands at a higher cost: 1 ^ x, x * 1, x / 1 and x ^ 1.
+            # (x + 0, x * 0 and x ^ 0 can not happen, values are positive)
+            max_value2 = max_exponent(value1, max_value) if value1 > 1 else 0
+            stop = bisect_right(partner_values, max(value1, max_value2))
+
+            for combo2 in partners[:stop]:
+                value2 = combo2.value
+
+                # Cost is the same for every operation
+                cost = cost1 + combo2.cost
 
-            for combo2 in known:
                 # We only run cases where combo1 >= combo2
                 #   + and * are commutative
                 #   / and - are not commutative, but problem deals with
                 #           positive integers, so it does not make sense
                 #           to run cases where combo1 < combo2
-                for op in ["+", "-", "*", "/"]:
-                    if combo1.value >= combo2.value:
-                        updates += new_combos.state_update(binary_operation(combo1, combo2, op))
+                # The operations are written out (see BINARY_VALUES), as
+                # this runs for every pair.
+                if value1 >= value2:
+                    value = value1 + value2
+                    if 1 <= value <= max_value and cost < best_cost[value]:
+                        updates += add(binary_operation(combo1, combo2, "+"))
+                    value = value1 - value2
+                    if 1 <= value <= max_value and cost < best_cost[value]:
+                        updates += add(binary_operation(combo1, combo2, "-"))
+                    if value2 > 1:
+                        value = value1 * value2
+                        if 1 <= value <= max_value and cost < best_cost[value]:
+                            updates += add(binary_operation(combo1, combo2, "*"))
+                        if value1 % value2 == 0:
+                            value = value1 // value2
+                            if 1 <= value <= max_value and cost < best_cost[value]:
+                                updates += add(binary_operation(combo1, combo2, "/"))
 
                 # We need to run both cases (combo1 > combo2, and combo2 > combo1)
                 #   ^
-                for op in ["^"]:
-                    updates += new_combos.state_update(binary_operation(combo1, combo2, op))
+                if value2 > max_value2 or value2 == 1:
+                    continue
+                value = power_value(value1, value2)
+                if value is not None and 1 <= value <= max_value and cost < best_cost[value]:
+                    updates += add(binary_operation(combo1, combo2, "^"))
 
-        self.state_merge(new_combos)
+        self.state.update(delta)
+        # Every known combination has been expanded now. Only those are kept,
+        # combinations replaced in earlier rounds can not be paired again.
+        self.expanded = set(known)
 
         return updates
 
@@ -249,7 +356,21 @@ class Model:
         """
         return list(self.state.values())
 
-    def asdict(self) -> dict[str, Any]:
+    def iter_sorted(self) -> Iterator[Combo]:
+        """
+        Iterate over combinations, in increasing order of value.
+
+        State is keyed by value, so only the integer keys are sorted,
+        without comparing Combo objects.
+
+        Yields:
+            Combo: combinations, from lowest to highest value.
+        """
+        state = self.state
+        for value in sorted(state):
+            yield state[value]
+
+    def asdict(self, combos: Iterable[Combo] | None = None) -> dict[str, Any]:
         """
         Create a dictionary representation of the Model object.
 
@@ -257,12 +378,17 @@ class Model:
         object from a dictionary are used during object serialization. That
         functionality is used when taking snapshots of a Model simulation.
 
+        Args:
+            combos (Iterable[Combo], optional): combinations of the model,
+                already sorted by value (see iter_sorted()). The state is
+                sorted when they are not given.
+
         Returns:
             dict[str, Any]: dictionary with the dataclass fields.
         """
-        state = []
-        for num in sorted(self.state.keys()):
-            state.append(self.state[num].asdict())
+        if combos is None:
+            combos = self.iter_sorted()
+        state = [combo.asdict() for combo in combos]
 
         obj = {
             "digit": self.digit,
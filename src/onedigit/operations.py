@@ -1,9 +1,139 @@
 """Pure functions for arithmetic operations on Combo objects."""
 
 import math
+import operator
+from collections.abc import Callable
 
 from .combo import Combo
 
+# Text of the most common values, so expressions do not convert the
+# same numbers to strings over and over (values up to the default
+# max_value of the models).
+_VALUE_TEXT = [str(i) for i in range(10000)]
+_VALUE_TEXT_SIZE = len(_VALUE_TEXT)
+
+# Result of operations that are not valid. Combo objects are immutable,
+# so a single object can be shared by all of them.
+_INVALID = Combo(value=0)
+
+# Factorials of all the numbers allowed by unary_value()
+_FACTORIALS = tuple(math.factorial(i) for i in range(21))
+
+
+def unary_value(value1: int, op: str) -> int | None:
+    """
+    Calculate the value of an operation on a single number.
+
+    Only the number is calculated, no Combo object is built. This lets
+    callers discard results before paying for their expressions.
+
+    Args:
+        value1 (int): the number to apply the operation on.
+        op (str): operation to run (!, sqrt).
+
+    Raises:
+        ValueError: when receiving an invalid operation
+
+    Returns:
+        int: the result, or None if the operation is not valid for this number
+            (see unary_operation()).
+    """
+    match op:
+        case "!":
+            if (value1 < 0) or (value1 > 20):
+                return None
+            return _FACTORIALS[value1]
+        case "sqrt":
+            if value1 < 0:
+                # Prevent irrational values
+                return None
+            rc_val = math.isqrt(value1)
+            if (rc_val * rc_val) != value1:
+                # Only allow expressions that result in exact integer values
+                return None
+            return rc_val
+        case _:
+            raise ValueError("bad operator:", op)
+
+
+def _divide_value(value1: int, value2: int) -> int | None:
+    """Integer division, only valid when there is no remainder."""
+    if value1 % value2 != 0:
+        return None
+    return value1 // value2
+
+
+def _power_value(value1: int, value2: int) -> int | None:
+    """Exponentiation, only valid for small non-negative exponents."""
+    # Prevent immensely large operations
+    if value1 < 0 or value2 > 40:
+        return None
+    # Prevent irrational values
+    if value2 < 0:
+        return None
+    return int(value1**value2)
+
+
+# Functions that calculate each binary operation (see binary_value()).
+# Callers in hot loops can look an operation up once, and call it
+# directly for each pair of numbers.
+BINARY_VALUES: dict[str, Callable[[int, int], int | None]] = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": _divide_value,
+    "^": _power_value,
+}
+
+
+def binary_value(value1: int, value2: int, op: str) -> int | None:
+    """
+    Calculate the value of an operation between two numbers.
+
+    Only the number is calculated, no Combo object is built. This lets
+    callers discard results before paying for their expressions.
+
+    Args:
+        value1 (int): first number to use
+        value2 (int): second number to use
+        op (str): operation to perform between both numbers (+, -, *, /, ^).
+
+    Raises:
+        ValueError: when receiving an invalid operation
+
+    Returns:
+        int: the result, or None if the operation is not valid for these numbers
+            (see binary_operation()).
+    """
+    op_value = BINARY_VALUES.get(op)
+    if op_value is None:
+        raise ValueError("bad operator:", op)
+    return op_value(value1, value2)
+
+
+def max_exponent(value1: int, max_value: int) -> int:
+    """
+    Get the largest exponent worth using with a number as base.
+
+    Exponents above it either give results larger than 'max_value',
+    or are not valid (see binary_value()).
+
+    Args:
+        value1 (int): the base of the exponentiation (positive).
+        max_value (int): largest result to allow.
+
+    Returns:
+        int: the largest useful exponent.
+    """
+    if value1 <= 1:
+        return 40
+
+    exponent, power = 0, value1
+    while power <= max_value and exponent < 40:
+        exponent += 1
+        power *= value1
+    return exponent
+
 
 def unary_operation(combo1: Combo, op: str) -> Combo:
     """
@@ -39,30 +169,24 @@ def unary_operation(combo1: Combo, op: str) -> Combo:
     Returns:
         Combo: a new Combo object.
     """
+    rc_val = unary_value(combo1.value, op)
+    if rc_val is None:
+        return _INVALID
+
     # Only use parenthesis for cases it helps (if expression has spaces)
     value1_expr_full = combo1.expr_full
     if " " in value1_expr_full:
         value1_expr_full = "(" + value1_expr_full + ")"
 
-    match op:
-        case "!":
-            if (combo1.value < 0) or (combo1.value > 20):
-                return Combo(value=0)
-            rc_val = math.factorial(combo1.value)
-            rc_expr_full = value1_expr_full + "!"
-            rc_expr_simple = str(combo1.value) + "!"
-        case "sqrt":
-            if combo1.value < 0:
-                # Prevent irrational values
-                return Combo(value=0)
-            rc_val = math.isqrt(combo1.value)
-            if (rc_val * rc_val) != combo1.value:
-                # Only allow expressions that result in exact integer values
-                return Combo(value=0)
-            rc_expr_full = "√(" + value1_expr_full + ")"
-            rc_expr_simple = "√(" + str(combo1.value) + ")"
-        case _:
-            raise ValueError("bad operator:", op)
+    value1 = combo1.value
+    value1_text = _VALUE_TEXT[value1] if 0 <= value1 < _VALUE_TEXT_SIZE else str(value1)
+
+    if op == "!":
+        rc_expr_full = value1_expr_full + "!"
+        rc_expr_simple = value1_text + "!"
+    else:
+        rc_expr_full = "√(" + value1_expr_full + ")"
+        rc_expr_simple = "√(" + value1_text + ")"
 
     return Combo(
         value=rc_val,
@@ -106,6 +230,10 @@ def binary_operation(combo1: Combo, combo2: Combo, op: str) -> Combo:
     Returns:
         Combo: the result of the operation, as a new Combo object.
     """
+    rc_val = binary_value(combo1.value, combo2.value, op)
+    if rc_val is None:
+        return _INVALID
+
     cost = combo1.cost + combo2.cost
 
     # Only use parenthesis for cases it helps (if expression has spaces)
@@ -115,43 +243,10 @@ def binary_operation(combo1: Combo, combo2: Combo, op: str) -> Combo:
     if " " in value2_expr_full:
         value2_expr_full = "(" + value2_expr_full + ")"
 
-    match op:
-        case "+":
-            rc_val = combo1.value + combo2.value
-            rc_expr_full = f"{value1_expr_full} + {value2_expr_full}"
-            rc_expr_simple = f"{combo1.value} + {combo2.value}"
-
-        case "-":
-            rc_val = combo1.value - combo2.value
-            rc_expr_full = f"{value1_expr_full} - {value2_expr_full}"
-            rc_expr_simple = f"{combo1.value} - {combo2.value}"
-
-        case "*":
-            rc_val = combo1.value * combo2.value
-            rc_expr_full = f"{value1_expr_full} * {value2_expr_full}"
-            rc_expr_simple = f"{combo1.value} * {combo2.value}"
-
-        case "/":
-            if combo1.value % combo2.value != 0:
-                return Combo(value=0)
-
-            rc_val = combo1.value // combo2.value
-            rc_expr_full = f"{value1_expr_full} / {value2_expr_full}"
-            rc_expr_simple = f"{combo1.value} / {combo2.value}"
-
-        case "^":
-            # Prevent immensely large operations
-            if combo1.value < 0 or combo2.value > 40:
-                return Combo(value=0)
-            # Prevent irrational values
-            if combo2.value < 0:
-                return Combo(value=0)
-
-            rc_val = combo1.value**combo2.value
-            rc_expr_full = f"{value1_expr_full} ^ {value2_expr_full}"
-            rc_expr_simple = f"{combo1.value} ^ {combo2.value}"
-
-        case _:
-            raise ValueError("bad operator:", op)
+    rc_expr_full = f"{value1_expr_full} {op} {value2_expr_full}"
+    value1, value2 = combo1.value, combo2.value
+    value1_text = _VALUE_TEXT[value1] if 0 <= value1 < _VALUE_TEXT_SIZE else str(value1)
+    value2_text = _VALUE_TEXT[value2] if 0 <= value2 < _VALUE_TEXT_SIZE else str(value2)
+    rc_expr_simple = f"{value1_text} {op} {value2_text}"
 
     return Combo(value=rc_val, cost=cost, expr_full=rc_expr_full, expr_simple=rc_expr_simple)
@@ -1,7 +1,6 @@
 """Functionality for easy access. It schedules the operations that calculate the combinations."""
 
-import json
-
+from .jsonio import decode_json
 from .logger import get_logger
 from .model import Model
 
@@ -14,7 +13,7 @@ def calculate(
     max_value: int = 9999,
     max_cost: int = 10,
     max_steps: int = 10,
-    input_json: str,
+    input_json: str | bytes,
 ) -> Model | None:
     """
     Run a simple calculation.
@@ -24,7 +23,7 @@ def calculate(
         max_value (int, optional): largest value to remember. Defaults to 9999.
         max_cost (int, optional): maximum cost a combination can have to be remembered. Defaults to 10.
         max_steps (int, optional): maximum number of steps (iterations) to run. Defaults to 10.
-        input_json (str, optional): JSON model data. Defaults to empty.
+        input_json (str | bytes, optional): JSON model data, as text or UTF-8 bytes. Defaults to empty.
 
     Returns:
         Model: model object, or None if there is a failure.
@@ -42,7 +41,7 @@ def calculate(
     return mymodel
 
 
-def get_model(digit: int, *, max_value: int = 9999, max_cost: int = 2, input_json: str = "") -> Model | None:
+def get_model(digit: int, *, max_value: int = 9999, max_cost: int = 2, input_json: str | bytes = "") -> Model | None:
     """
     Obtain an initial model.
 
@@ -53,7 +52,7 @@ def get_model(digit: int, *, max_value: int = 9999, max_cost: int = 2, input_jso
         digit (int): digit to use
         max_value (int, optional): largest value to remember. Defaults to 9999.
         max_cost (int, optional): maximum cost a combination can have to be remembered. Defaults to 10.
-        input_json (str, optional): JSON text that represents a model. Defaults to empty.
+        input_json (str | bytes, optional): JSON text that represents a model. Defaults to empty.
 
     Returns:
         Model: a model, or None.
@@ -66,8 +65,7 @@ def get_model(digit: int, *, max_value: int = 9999, max_cost: int = 2, input_jso
 
     # Parse the input JSON
     if mymodel and input_json:
-        json_dec = json.JSONDecoder()
-        input_dict = json_dec.decode(input_json)
+        input_dict = decode_json(input_json)
 
         if input_dict:
             # Ingest the actual dictionary
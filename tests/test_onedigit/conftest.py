@@ -1 +1,10 @@
 """Fixtures available to the entire test suite."""
+
+import os
+
+from hypothesis import settings
+
+# CI runs in fresh containers, so a database of failing examples is never
+# reused there; the profile skips it. Local runs keep it to replay failures.
+settings.register_profile("ci", database=None)
+settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "ci" if os.environ.get("CI") else "default"))
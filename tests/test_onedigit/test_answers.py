@@ -1,12 +1,15 @@
 import unittest
 
-from hypothesis import given
+from hypothesis import given, settings
 from hypothesis import strategies as hst
 
 import onedigit
 
 
 class TestAnswers(unittest.TestCase):
+    # Each example runs a full (small) simulation, so use fewer of them.
+    # Run time depends on the parameters drawn, so there is no deadline.
+    @settings(max_examples=50, deadline=None)
     @given(
         digit=hst.integers(min_value=1, max_value=9),
         max_value=hst.integers(min_value=10, max_value=50),
@@ -0,0 +1,95 @@
+import os
+import shutil
+import tempfile
+import unittest
+from typing import Any
+from unittest.mock import patch
+
+from onedigit import cache
+from onedigit.cli import app
+
+
+class TestCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(lambda: shutil.rmtree(self.cache_dir, ignore_errors=True))
+
+    def test_cache_key(self) -> None:
+        key1 = cache.cache_key(3, max_value=100, max_cost=3, max_steps=2, input_json="")
+        key2 = cache.cache_key(3, max_value=100, max_cost=3, max_steps=2, input_json=b"")
+        key3 = cache.cache_key(3, max_value=100, max_cost=3, max_steps=3, input_json="")
+        key4 = cache.cache_key(3, max_value=100, max_cost=3, max_steps=2, input_json="{}")
+
+        # Text and bytes input are equivalent, any other change gives a new key
+        assert key1 == key2
+        assert len({key1, key3, key4}) == 3
+
+        # Results of another release of the package are not reused
+        with patch("onedigit.cache.__version__", "0.0.0"):
+            key5 = cache.cache_key(3, max_value=100, max_cost=3, max_steps=2, input_json="")
+        assert key5 != key1
+
+    def test_load_missing(self) -> None:
+        assert cache.load("missing", self.cache_dir) is None
+
+    def test_load_corrupted(self) -> None:
+        model_json = '{"digit": 3, "max_value": 10, "max_cost": 2, "combinations": %s}'
+        for content in [
+            "not json",
+            "5",
+            '{"digit": "3", "max_value": 10, "max_cost": 2, "combinations": []}',
+            model_json % "[[3, 1]]",
+            model_json % '[{"value": "3", "cost": 1, "expr_full": "3", "expr_simple": "3"}]',
+        ]:
+            with open(os.path.join(self.cache_dir, "bad.json"), "w") as f:
+                f.write(content)
+            assert cache.load("bad", self.cache_dir) is None, content
+
+    def test_cached_calculate(self) -> None:
+        kwargs: dict[str, Any] = {
+            "max_value": 50,
+            "max_cost": 3,
+            "max_steps": 2,
+            "input_json": "",
+            "cache_dir": self.cache_dir,
+        }
+        model1 = cache.cached_calculate(3, **kwargs)
+        assert model1 is not None
+        assert len(os.listdir(self.cache_dir)) == 1
+
+        # The second run must come from the cache
+        with patch("onedigit.cache.calculate") as mock_calculate:
+            model2 = cache.cached_calculate(3, **kwargs)
+            mock_calculate.assert_not_called()
+
+        assert model2 is not None
+        assert model2.asdict() == model1.asdict()
+
+    def test_store_failure(self) -> None:
+        model = cache.cached_calculate(
+            3, max_value=10, max_cost=2, max_steps=1, input_json="", cache_dir=self.cache_dir
+        )
+        assert model is not None
+
+        # A failed write is ignored, and does not leave a temporary file behind
+        store_dir = os.path.join(self.cache_dir, "store")
+        with patch("onedigit.cache.os.replace", side_effect=OSError("disk full")):
+            cache.store("key", store_dir, model)
+        assert os.listdir(store_dir) == []
+
+    def test_cli_cache_flag(self) -> None:
+        output_file = os.path.join(self.cache_dir, "output.json")
+        with patch.dict(os.environ, {"XDG_CACHE_HOME": self.cache_dir}):
+            args = ["3", "--max-value", "10", "--cache", "--output-filename", output_file]
+            assert app(args)
+            with open(output_file, "rb") as f:
+                output1 = f.read()
+
+            # The second run must come from the cache
+            with patch("onedigit.cache.calculate") as mock_calculate:
+                assert app(args)
+                mock_calculate.assert_not_called()
+            with open(output_file, "rb") as f:
+                assert f.read() == output1
+
+        assert os.listdir(os.path.join(self.cache_dir, "onedigit"))
@@ -8,27 +8,38 @@ import unittest
 from io import StringIO
 from unittest.mock import patch
 
-from onedigit.cli import _create_parser, _main, app
+from onedigit.cli import _create_parser, _get_parser, _main, app
+from onedigit.logger import init_logger
 
 # This test file focuses on testing the parsing and validation of command line arguments
 # for the 'cli' module. It is not an end-to-end test. The actual results of calculations
 # are tested in other unit tests.
 
+# Input model with no combinations, written to the input files of several tests
+# (combinations is a list, not a dict)
+_EMPTY_MODEL_JSON = json.dumps({"digit": 3, "max_value": 100, "max_cost": 3, "combinations": []})
+
 
 class TestCli(unittest.TestCase):
     """Test cases for the new argparse-based CLI."""
 
-    def setUp(self) -> None:
-        """Set up test environment."""
-        # Create temporary directory for test files
-        self.temp_dir = tempfile.mkdtemp()
-        self.addCleanup(lambda: self._cleanup_temp_dir())
+    temp_root: str
 
-    def _cleanup_temp_dir(self) -> None:
-        """Clean up temporary directory."""
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Create a temporary directory shared by all tests of the class."""
+        cls.temp_root = tempfile.mkdtemp()
 
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Clean up the shared temporary directory."""
+        shutil.rmtree(cls.temp_root, ignore_errors=True)
+
+    def setUp(self) -> None:
+        """Set up test environment."""
+        # Each test gets its own subdirectory for test files
+        self.temp_dir = os.path.join(self.temp_root, self._testMethodName)
+        os.mkdir(self.temp_dir)
 
     def test_parser_creation(self) -> None:
         """Test that the argument parser is created correctly."""
@@ -36,6 +47,10 @@ class TestCli(unittest.TestCase):
         self.assertIsNotNone(parser)
         self.assertEqual(parser.prog, "onedigit")
 
+    def test_parser_cached(self) -> None:
+        """Test that the argument parser is shared between calls."""
+        self.assertIs(_get_parser(), _get_parser())
+
     def test_main_basic_functionality(self) -> None:
         """Test basic functionality with valid inputs."""
         result = _main(
@@ -49,6 +64,25 @@ class TestCli(unittest.TestCase):
         )
         self.assertTrue(result)
 
+    def test_main_skips_debug_message(self) -> None:
+        """Test the debug message is not built when the log level is higher."""
+        with patch.dict(os.environ, {"ONEDIGIT_LOG_LEVEL": "INFO"}):
+            init_logger()
+        self.addCleanup(init_logger)
+
+        with patch("onedigit.cli.logger.debug") as mock_debug:
+            result = _main(
+                digit=3,
+                max_value=10,
+                max_cost=2,
+                max_steps=2,
+                full=False,
+                input_filename="",
+                output_filename="",
+            )
+            self.assertTrue(result)
+            mock_debug.assert_not_called()
+
     def test_main_with_nonexistent_input_file(self) -> None:
         """Test error handling for non-existent input file."""
         result = _main(
@@ -65,16 +99,9 @@ class TestCli(unittest.TestCase):
     def test_main_with_valid_json_input(self) -> None:
         """Test loading a valid JSON input file."""
         # Create a test JSON file with proper structure
-        test_data = {
-            "digit": 3,
-            "max_value": 100,
-            "max_cost": 3,
-            "combinations": [],  # This should be a list, not a dict
-        }
-
         json_file = os.path.join(self.temp_dir, "test_input.json")
         with open(json_file, "w") as f:
-            json.dump(test_data, f)
+            f.write(_EMPTY_MODEL_JSON)
 
         result = _main(
             digit=3,
@@ -105,9 +132,11 @@ class TestCli(unittest.TestCase):
 
         # Verify the output file contains valid JSON
         with open(output_file, "r") as f:
-            data = json.load(f)
+            data = json.loads(f.read())
             self.assertIsInstance(data, dict)
 
+    @unittest.skipIf(os.name == "nt", "file modes do not prevent reading on Windows")
+    @unittest.skipIf(hasattr(os, "geteuid") and os.geteuid() == 0, "root can read files without permissions")
     def test_main_with_permission_error_input(self) -> None:
         """Test error handling for permission error on input file."""
         # Create a file and remove read permissions
@@ -192,6 +221,21 @@ class TestCli(unittest.TestCase):
         result = app(args)
         self.assertFalse(result)
 
+    def test_cmdline2_with_out_of_range_args(self) -> None:
+        """Test cmdline2 with numbers outside of the accepted ranges."""
+        for args in [
+            ["0"],
+            ["10"],
+            ["3", "--max-value", "0"],
+            ["3", "--max-value", "1000001"],
+            ["3", "--max-cost", "31"],
+            ["3", "--max-steps", "0"],
+            ["3", "--max-steps", "abc"],
+            ["1-3", "--jobs", "0"],
+        ]:
+            with patch("sys.stderr", new_callable=StringIO):
+                self.assertFalse(app(args), args)
+
     def test_cmdline2_with_full_flag(self) -> None:
         """Test cmdline2 with full flag."""
         args = ["3", "--full", "--max-value", "10"]
@@ -201,15 +245,25 @@ class TestCli(unittest.TestCase):
     def test_cmdline2_with_input_file(self) -> None:
         """Test cmdline2 with input file."""
         # Create a test JSON file with proper structure
-        test_data = {"digit": 3, "max_value": 100, "max_cost": 3, "combinations": []}
         json_file = os.path.join(self.temp_dir, "test_input.json")
         with open(json_file, "w") as f:
-            json.dump(test_data, f)
+            f.write(_EMPTY_MODEL_JSON)
 
         args = ["3", "--input-filename", json_file, "--max-value", "10"]
         result = app(args)
         self.assertTrue(result)
 
+    def test_cmdline2_with_invalid_combination_in_input_file(self) -> None:
+        """Test cmdline2 with an input file whose combinations are not valid."""
+        json_file = os.path.join(self.temp_dir, "test_input.json")
+        free_combination = {"value": 3, "cost": 0, "expr_full": "3", "expr_simple": "3"}
+        for combination in ([3, 1], "3", 3, free_combination):
+            with open(json_file, "w") as f:
+                json.dump({"digit": 3, "max_value": 100, "max_cost": 3, "combinations": [combination]}, f)
+
+            args = ["3", "--input-filename", json_file, "--max-value", "10"]
+            self.assertFalse(app(args), combination)
+
     def test_cmdline2_with_output_file(self) -> None:
         """Test cmdline2 with output file."""
         output_file = os.path.join(self.temp_dir, "test_output.json")
@@ -238,6 +292,54 @@ class TestCli(unittest.TestCase):
         result = app(args)
         self.assertTrue(result)
 
+    def test_cmdline2_with_digit_range(self) -> None:
+        """Test cmdline2 with a range of digits, one output file per digit."""
+        output_file = os.path.join(self.temp_dir, "test_output.json")
+        args = ["2-4", "--max-value", "10", "--output-filename", output_file]
+        result = app(args)
+        self.assertTrue(result)
+        for digit in [2, 3, 4]:
+            self.assertTrue(os.path.exists(os.path.join(self.temp_dir, f"test_output.{digit}.json")))
+
+    def test_cmdline2_with_digit_range_jobs(self) -> None:
+        """Test cmdline2 with a range of digits calculated in several processes."""
+        output_file = os.path.join(self.temp_dir, "test_output.json")
+        args = ["1-3", "--jobs", "2", "--max-value", "10", "--output-filename", output_file]
+        result = app(args)
+        self.assertTrue(result)
+
+        # Results must match the ones calculated in this process
+        for digit in [1, 2, 3]:
+            single_file = os.path.join(self.temp_dir, f"single.{digit}.json")
+            self.assertTrue(app([str(digit), "--max-value", "10", "--output-filename", single_file]))
+            with open(single_file) as f1, open(os.path.join(self.temp_dir, f"test_output.{digit}.json")) as f2:
+                self.assertEqual(json.load(f1), json.load(f2))
+
+    def test_cmdline2_with_invalid_digit_range(self) -> None:
+        """Test cmdline2 with invalid ranges of digits."""
+        for digit in ["5-3", "0-3", "3-", "a-b"]:
+            self.assertFalse(app([digit, "--max-value", "10"]))
+
+        # A reversed range is not reported as a digit out of range
+        with patch("sys.stderr", new_callable=StringIO) as mock_stderr:
+            self.assertFalse(app(["3-1"]))
+        self.assertIn("increasing order", mock_stderr.getvalue())
+        self.assertNotIn("between 1 and 9", mock_stderr.getvalue())
+
+    def test_cmdline2_with_single_digit_jobs(self) -> None:
+        """Test cmdline2 warns that jobs are not used for a single digit."""
+        with self.assertLogs("onedigit", level="WARNING") as logs:
+            self.assertTrue(app(["3", "--jobs", "2", "--max-value", "10"]))
+        self.assertIn("jobs is ignored", "\n".join(logs.output))
+
+    def test_cmdline2_with_digit_range_and_input_file(self) -> None:
+        """Test cmdline2 rejects an input file for a range of digits."""
+        json_file = os.path.join(self.temp_dir, "test_input.json")
+        with open(json_file, "w") as f:
+            f.write(_EMPTY_MODEL_JSON)
+
+        self.assertFalse(app(["1-3", "--input-filename", json_file]))
+
     def test_main_large_parameters(self) -> None:
         """Test with large parameter values."""
         result = _main(
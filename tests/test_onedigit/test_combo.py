@@ -1,15 +1,34 @@
+import functools
 import math
 import re
 import unittest
+from types import CodeType
 
-from hypothesis import given
+from hypothesis import given, settings
 from hypothesis import strategies as hst
 
 from onedigit.combo import Combo
-from onedigit.operations import binary_operation, unary_operation
+from onedigit.operations import binary_operation, binary_value, max_exponent, unary_operation, unary_value
 
 # For an explanation of the Combo class, look at `docs/solver.md#combo-representation`.
 
+# Each example is cheap and the properties are simple, so fewer examples are
+# enough. Timing varies with the eval() of expressions, so there is no deadline.
+_COMBO_SETTINGS = settings(max_examples=25, deadline=None)
+
+# Factorials in expressions: "(expr)!" and "5!"
+_PAREN_FACTORIAL = re.compile(r"\(([^)]+)\)!")
+_NUMBER_FACTORIAL = re.compile(r"(\d+)!")
+
+# Custom operators and their Python syntax, converted in a single pass
+_OPERATOR_TABLE = str.maketrans({"^": "**", "/": "//", "√": "math.isqrt"})
+
+
+@functools.lru_cache(maxsize=2048)
+def _compile_expression(expr: str) -> CodeType:
+    """Compile an expression once, examples often repeat the same ones."""
+    return compile(expr, "<combo-test>", "eval")
+
 
 class Test_Combo(unittest.TestCase):
     def combination_to_python_expression(self, expr: str) -> str:
@@ -26,15 +45,14 @@ class Test_Combo(unittest.TestCase):
             Converted expression string suitable for Python eval()
         """
         # Convert custom operators to Python syntax
-        expr_mod = expr.replace("^", "**")
-        expr_mod = expr_mod.replace("/", "//")
-        expr_mod = expr_mod.replace("√", "math.isqrt")
+        expr_mod = expr.translate(_OPERATOR_TABLE)
 
         # Handle factorial (postfix notation): convert "expr!" to "math.factorial(expr)"
-        # First handle parenthesized expressions: (expr)! -> math.factorial(expr)
-        expr_mod = re.sub(r"\(([^)]+)\)!", r"math.factorial(\1)", expr_mod)
-        # Then handle simple numbers: 5! -> math.factorial(5)
-        expr_mod = re.sub(r"(\d+)!", r"math.factorial(\1)", expr_mod)
+        if "!" in expr_mod:
+            # First handle parenthesized expressions: (expr)! -> math.factorial(expr)
+            expr_mod = _PAREN_FACTORIAL.sub(r"math.factorial(\1)", expr_mod)
+            # Then handle simple numbers: 5! -> math.factorial(5)
+            expr_mod = _NUMBER_FACTORIAL.sub(r"math.factorial(\1)", expr_mod)
 
         return expr_mod
 
@@ -53,7 +71,7 @@ class Test_Combo(unittest.TestCase):
         """
         try:
             # Note: Using eval() here is acceptable for test code with controlled input.
-            result = eval(expr, {"__builtins__": {}}, {"math": math})  # nosec B307
+            result = eval(_compile_expression(expr), {"__builtins__": {}}, {"math": math})  # nosec B307
         except Exception as e:
             raise AssertionError(f"Expression '{expr}' failed to evaluate: {e}")
 
@@ -90,12 +108,14 @@ class Test_Combo(unittest.TestCase):
         # This check should really be done by the caller of this method.
         assert combo_obj.cost > 1000
 
+    @_COMBO_SETTINGS
     @given(value1=hst.integers())
     def test_combo_positional(self, value1: int) -> None:
         combo1 = Combo(value1)
         self.check_combo(combo1, value1)
 
     # For serialization
+    @_COMBO_SETTINGS
     @given(value=hst.integers(min_value=1), cost=hst.integers(min_value=1))
     def test_combo_to_dictionary(self, value: int, cost: int) -> None:
         # Create a simple combo, and get its dictionary
@@ -123,6 +143,18 @@ class Test_Combo(unittest.TestCase):
         assert isinstance(dict1["expr_simple"], str)
         assert dict1["expr_simple"] == str(value)
 
+    @_COMBO_SETTINGS
+    @given(value=hst.integers(min_value=1), cost=hst.integers(min_value=1))
+    def test_combo_immutable(self, value: int, cost: int) -> None:
+        combo1 = Combo(value=value, cost=cost)
+        assert combo1.value == value
+        assert combo1.cost == cost
+
+        # Objects are immutable
+        with self.assertRaises(expected_exception=AttributeError):
+            combo1.cost = cost + 1  # type: ignore[misc]
+
+    @_COMBO_SETTINGS
     @given(value1=hst.integers())
     def test_combo_repr(self, value1: int) -> None:
         combo1 = Combo(value1)
@@ -131,6 +163,7 @@ class Test_Combo(unittest.TestCase):
 
         assert str1
 
+    @_COMBO_SETTINGS
     @given(value1=hst.integers(), value2=hst.integers())
     def test_combo_ordering(self, value1: int, value2: int) -> None:
         combo1 = Combo(value1)
@@ -148,6 +181,7 @@ class Test_Combo(unittest.TestCase):
             assert not (combo1 < combo2)
             assert not (combo1 > combo2)
 
+    @_COMBO_SETTINGS
     @given(value1=hst.integers(), value2=hst.integers())
     def test_combo_addition(self, value1: int, value2: int) -> None:
         combo1 = Combo(value1)
@@ -159,6 +193,7 @@ class Test_Combo(unittest.TestCase):
         self.check_combo(combo3, value1 + value2)
         self.check_combo(combo4, value2 + value1)
 
+    @_COMBO_SETTINGS
     @given(value1=hst.integers(), value2=hst.integers())
     def test_combo_subtraction(self, value1: int, value2: int) -> None:
         combo1 = Combo(value1)
@@ -170,6 +205,7 @@ class Test_Combo(unittest.TestCase):
         self.check_combo(combo3, value1 - value2)
         self.check_combo(combo4, value2 - value1)
 
+    @_COMBO_SETTINGS
     @given(value1=hst.integers(), value2=hst.integers())
     def test_combo_multiplication(self, value1: int, value2: int) -> None:
         combo1 = Combo(value1)
@@ -181,6 +217,7 @@ class Test_Combo(unittest.TestCase):
         self.check_combo(combo3, value1 * value2)
         self.check_combo(combo4, value2 * value1)
 
+    @_COMBO_SETTINGS
     @given(value1=hst.integers())
     def test_combo_integer_division_by_zero(self, value1: int) -> None:
         combo1 = Combo(value1)
@@ -190,6 +227,7 @@ class Test_Combo(unittest.TestCase):
             combo3 = binary_operation(combo1, combo2, "/")
             assert combo3.value == 0
 
+    @_COMBO_SETTINGS
     @given(value1=hst.integers(min_value=1))
     def test_combo_integer_division_by_one(self, value1: int) -> None:
         combo1 = Combo(value1)
@@ -201,6 +239,7 @@ class Test_Combo(unittest.TestCase):
         self.check_combo(combo3, 1)
         self.check_combo(combo4, 1)
 
+    @_COMBO_SETTINGS
     @given(value1=hst.integers(min_value=1), value2=hst.integers(min_value=1))
     def test_combo_integer_division(self, value1: int, value2: int) -> None:
         combo1 = Combo(value1)
@@ -219,6 +258,7 @@ class Test_Combo(unittest.TestCase):
         else:
             self.check_combo(combo4, 0)
 
+    @_COMBO_SETTINGS
     @given(value1=hst.integers(min_value=1), value2=hst.integers(min_value=0, max_value=50))
     def test_combo_integer_exponentiation(self, value1: int, value2: int) -> None:
         combo1 = Combo(value1)
@@ -235,6 +275,7 @@ class Test_Combo(unittest.TestCase):
 
         self.check_combo(combo3, (value1**value2))
 
+    @_COMBO_SETTINGS
     @given(value1=hst.integers(min_value=1), value2=hst.integers(max_value=-1))
     def test_combo_integer_exponentiation_negative_exponent(self, value1: int, value2: int) -> None:
         combo1 = Combo(value1)
@@ -245,6 +286,7 @@ class Test_Combo(unittest.TestCase):
         # Negative exponents are not allowed, thus result should be zero
         self.check_combo(combo3, 0)
 
+    @_COMBO_SETTINGS
     @given(value1=hst.integers())
     def test_combo_sqrt(self, value1: int) -> None:
         combo1 = Combo(value1)
@@ -263,6 +305,7 @@ class Test_Combo(unittest.TestCase):
 
         self.check_combo(combo2, expected1)
 
+    @_COMBO_SETTINGS
     @given(value1=hst.integers(max_value=50))
     def test_combo_factorial(self, value1: int) -> None:
         combo1 = Combo(value1)
@@ -277,3 +320,42 @@ class Test_Combo(unittest.TestCase):
             return
 
         self.check_combo(combo2, math.factorial(value1))
+
+    @_COMBO_SETTINGS
+    @given(value1=hst.integers(min_value=-50, max_value=50), value2=hst.integers(min_value=1, max_value=50))
+    def test_values_match_operations(self, value1: int, value2: int) -> None:
+        combo1 = Combo(value1)
+        combo2 = Combo(value2)
+
+        # Invalid results are reported as None, instead of a zero Combo
+        for op in ["+", "-", "*", "/", "^"]:
+            value = binary_value(value1, value2, op)
+            assert binary_operation(combo1, combo2, op).value == (0 if value is None else value)
+
+        for op in ["!", "sqrt"]:
+            value = unary_value(value1, op)
+            assert unary_operation(combo1, op).value == (0 if value is None else value)
+
+    @_COMBO_SETTINGS
+    @given(value1=hst.integers(min_value=1, max_value=100), max_value=hst.integers(min_value=1, max_value=10**6))
+    def test_max_exponent(self, value1: int, max_value: int) -> None:
+        limit = max_exponent(value1, max_value)
+
+        # Exponents above the limit never give a valid result in range
+        for value2 in range(1, 50):
+            value = binary_value(value1, value2, "^")
+            if value is not None and value <= max_value:
+                assert value2 <= limit
+
+    @_COMBO_SETTINGS
+    @given(value1=hst.integers(min_value=1), value2=hst.integers(min_value=41))
+    def test_combo_invalid_shared(self, value1: int, value2: int) -> None:
+        combo1 = Combo(value1)
+        combo2 = Combo(value2)
+
+        # Invalid results are all the same zero Combo
+        combo3 = binary_operation(combo1, combo2, "^")
+        combo4 = unary_operation(combo2, "!")
+
+        assert combo3.value == 0
+        assert combo3 is combo4
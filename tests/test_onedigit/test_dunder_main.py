@@ -11,3 +11,23 @@ def test_can_run_as_python_module() -> None:
     )
     assert result.returncode == 0
     assert b"usage: onedigit" in result.stdout
+
+
+def test_package_imports_lazily() -> None:
+    """Import the package without loading its modules until they are used."""
+    code = (
+        "import sys, onedigit\n"
+        "assert 'onedigit.cli' not in sys.modules\n"
+        "assert onedigit.Model.__name__ == 'Model'\n"
+        "assert 'onedigit.model' in sys.modules\n"
+        "assert 'onedigit.cli' not in sys.modules\n"
+        "assert onedigit.combo.Combo is onedigit.Combo\n"
+        "assert 'onedigit.cli' not in sys.modules\n"
+        "assert onedigit.cli.app is onedigit.app\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        capture_output=True,
+    )
+    assert result.returncode == 0
@@ -0,0 +1,46 @@
+import json
+import unittest
+from io import BytesIO
+from typing import Any
+from unittest.mock import patch
+
+import onedigit.jsonio
+from onedigit.jsonio import write_json
+
+
+class TestJsonio(unittest.TestCase):
+    def test_write_json(self) -> None:
+        """Test JSON output of dictionaries, including integers beyond 64 bits."""
+        combos = [{"value": i, "cost": 2, "expr_full": "3 + 3", "expr_simple": "3 + 3"} for i in range(10_000)]
+        combos[5_000]["value"] = 9**40
+        data_list: list[dict[str, Any]] = [
+            {"digit": 3, "combinations": []},
+            {"value": 9**40},
+            {"digit": 3, "max_cost": 2, "combinations": combos},
+        ]
+        for data in data_list:
+            output_fp = BytesIO()
+            write_json(data, output_fp)
+            self.assertFalse(output_fp.closed)
+            self.assertEqual(json.loads(output_fp.getvalue()), data)
+
+    def test_write_json_is_batched(self) -> None:
+        """Test JSON output is written in a few large writes, not one per item."""
+
+        class CountingBytesIO(BytesIO):
+            writes = 0
+
+            def write(self, data: Any) -> int:
+                self.writes += 1
+                return super().write(data)
+
+        combos = [{"value": i, "cost": 2, "expr_full": "3 + 3", "expr_simple": "3 + 3"} for i in range(10_000)]
+        data = {"digit": 3, "max_cost": 2, "combinations": combos}
+
+        # Check both encoders, with and without orjson
+        for has_orjson in sorted({False, onedigit.jsonio._HAS_ORJSON}):
+            with patch("onedigit.jsonio._HAS_ORJSON", has_orjson):
+                output_fp = CountingBytesIO()
+                write_json(data, output_fp)
+                self.assertEqual(json.loads(output_fp.getvalue()), data)
+                self.assertLess(output_fp.writes, len(combos) // 10)
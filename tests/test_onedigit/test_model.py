@@ -1,6 +1,7 @@
 import unittest
+import weakref
 
-from hypothesis import given
+from hypothesis import given, settings
 from hypothesis import strategies as hst
 
 import onedigit
@@ -38,15 +39,18 @@ class Test_Model(unittest.TestCase):
         assert isinstance(model.state[digit], onedigit.Combo)
         assert model.state[digit].value == digit
 
-    def model_match(self, model1: onedigit.Model, model2: onedigit.Model) -> bool:
-        # But models should be from the same digit space
-        assert model1.digit == model2.digit
-
+    def check_models_match(self, model1: onedigit.Model, model2: onedigit.Model) -> None:
         # Verify integrity of the objects
         self.check_model(model1, model1.digit)
         self.check_model(model2, model2.digit)
 
-        return False
+        # Check model parameters are identical
+        assert model1.digit == model2.digit
+        assert model1.max_value == model2.max_value
+        assert model1.max_cost == model2.max_cost
+
+        # Check their state matches as well, combinations compare all their fields
+        assert model1.state == model2.state
 
     @given(digit=hst.integers(min_value=1, max_value=9))
     def test_model_creation_good(self, digit: int) -> None:
@@ -55,7 +59,9 @@ class Test_Model(unittest.TestCase):
         model1.seed(max_value=99, max_cost=4)
         self.check_model(model1, digit)
 
-    @given(digit=hst.integers(min_value=10))
+    # Every digit above 9 fails the same way, a few fixed examples are enough
+    @settings(max_examples=10, deadline=None, derandomize=True, database=None)
+    @given(digit=hst.integers(min_value=10, max_value=1000))
     def test_model_creation_bad(self, digit: int) -> None:
         # Bad digit
         with self.assertRaises(expected_exception=ValueError):
@@ -78,7 +84,7 @@ class Test_Model(unittest.TestCase):
             # It can only have the digit in question
             digits = [d for d in c.expr_full if d in "0123456789"]
 
-            assert all([d == str(digit) for d in digits])
+            assert set(digits) == {str(digit)}
 
             # The cost must match the times the number appears
             assert c.cost == len(digits)
@@ -123,11 +129,11 @@ class Test_Model(unittest.TestCase):
         # add one extra combination (value = digit + digit)
         model1.state_update(binary_operation(combo1, combo1, "+"))
 
-        # Get a copy and delete the original objects
+        # Get a copy and drop the original, the copy must not keep it alive
         model2 = model1.copy()
-        del model1.state
+        original = weakref.ref(model1)
         del model1
-        del combo1
+        assert original() is None
 
         # Verify integrity of the copy, after we have deleted the original
         self.check_model(model2, digit)
@@ -142,23 +148,8 @@ class Test_Model(unittest.TestCase):
         model1.seed(max_value=99, max_cost=4)
         model2 = model1.copy()
 
-        # Verify integrity of the copy
-        self.check_model(model2, digit)
-
-        # Check model parameters are identical
-        assert model1.digit == model2.digit
-        assert model1.max_value == model2.max_value
-        assert model1.max_cost == model2.max_cost
-
-        # Check their state matches as well
-        assert len(model1.state) == len(model2.state)
-
-        for val in model1.state.keys():
-            assert val in model1.state
-            assert val == model1.state[val].value
-
-            assert val in model2.state
-            assert val == model2.state[val].value
+        # Verify the copy matches the original model
+        self.check_models_match(model1, model2)
 
     # For serialization
     @given(digit=hst.integers(min_value=1, max_value=9))
@@ -186,35 +177,80 @@ class Test_Model(unittest.TestCase):
         assert len(dict1["combinations"]) >= 1
 
     @given(digit=hst.integers(min_value=1, max_value=9))
-    def test_model_from_dictionary_basic(self, digit: int) -> None:
+    def test_model_from_dictionary(self, digit: int) -> None:
         # Create the dictionary of a model
         model1 = onedigit.Model(digit=digit)
         model1.seed(max_value=99, max_cost=4)
         dict1 = model1.asdict()
-        # Delete the original object to identify missing info
-        del model1.state
-        del model1
 
         # Check we can reconstruct the object
         model2 = onedigit.Model.fromdict(dict1)
         assert model2 is not None
 
-        # Verify the hydrated Model is valid
+        # Verify the hydrated Model matches the original model
+        self.check_models_match(model1, model2)
+
+        # Drop the original object, the hydrated Model must not depend on it
+        original = weakref.ref(model1)
+        del model1
+        assert original() is None
+
+        # Verify the hydrated Model is still valid on its own
         self.check_model(model2, digit)
 
     @given(digit=hst.integers(min_value=1, max_value=9))
-    def test_model_from_dictionary(self, digit: int) -> None:
-        # Create the dictionary of a model
+    def test_model_simulate_expanded(self, digit: int) -> None:
+        # Run a round, the combinations known before it are the expanded ones
         model1 = onedigit.Model(digit=digit)
-        model1.seed(max_value=99, max_cost=4)
-        dict1 = model1.asdict()
+        model1.seed(max_value=99, max_cost=3)
+        known = set(model1.state.values())
+        model1.simulate()
+        assert known == model1.expanded
 
-        # Check we can reconstruct the object
-        model2 = onedigit.Model.fromdict(dict1)
-        assert model2 is not None
+        # Running the rounds on a copy gives the same results as a fresh model
+        model2 = model1.copy()
+        model3 = onedigit.Model(digit=digit)
+        model3.seed(max_value=99, max_cost=3)
+        model3.simulate()
+        for _ in range(3):
+            model2.simulate()
+            model3.simulate()
+        assert model2.asdict() == model3.asdict()
+
+        # Seeding again forgets expanded combinations, as limits may change
+        model2.seed(max_value=99, max_cost=3)
+        assert not model2.expanded
 
-        # Verify the hydrated Model matches the original model
-        self.model_match(model1, model2)
+    @given(digit=hst.integers(min_value=1, max_value=9))
+    def test_model_simulate_skip_matches_full(self, digit: int) -> None:
+        # Skipping pairs of expanded combinations gives the same results as
+        # a model that evaluates every pair, because it forgets them each round
+        model1 = onedigit.Model(digit=digit)
+        model1.seed(max_value=1000, max_cost=5)
+        model2 = onedigit.Model(digit=digit)
+        model2.seed(max_value=1000, max_cost=5)
+        for _ in range(6):
+            model2.expanded.clear()
+            assert model1.simulate() == model2.simulate()
+            # Replaced combinations are not kept, at most one per value is expanded
+            assert len(model1.expanded) <= len(model1.state)
+        assert model1.asdict() == model2.asdict()
+
+    @given(digit=hst.integers(min_value=1, max_value=9))
+    def test_model_iter_sorted(self, digit: int) -> None:
+        model1 = onedigit.Model(digit=digit)
+        model1.seed(max_value=99, max_cost=3)
+        model1.simulate()
+
+        values = [c.value for c in model1.iter_sorted()]
+        assert values == sorted(model1.state.keys())
+
+    @given(digit=hst.integers(min_value=1, max_value=9))
+    def test_model_to_dictionary_sorted_combos(self, digit: int) -> None:
+        # Passing the already sorted combinations gives the same dictionary
+        model1 = onedigit.Model(digit=digit)
+        model1.seed(max_value=99, max_cost=3)
+        model1.simulate()
 
-        # The reverse relationship must also be satisfied
-        self.model_match(model2, model1)
+        combos = list(model1.iter_sorted())
+        assert model1.asdict(combos) == model1.asdict()